@@ -48,5 +48,7 @@ LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 # Processing Settings
 BATCH_SIZE = 10000  # Process in chunks for memory efficiency
+CHUNK_SIZE = 100000  # Rows per chunk when streaming large CSV files
+STREAMING_THRESHOLD_MB = 200  # Stream instead of loading whole file above this
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
\ No newline at end of file
@@ -4,10 +4,11 @@ Test Data Generator for Capstone Data Pipeline
 Generates realistic sales transaction data for testing ETL pipeline
 """
 
-import csv
-import random
 import argparse
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
 
 
 def generate_sales_data(num_records, output_file, date_str=None):
@@ -49,70 +50,58 @@ def generate_sales_data(num_records, output_file, date_str=None):
     print(f"🔄 Generating {num_records:,} sales records for {target_date.date()}...")
     print(f"📁 Output file: {output_file}")
 
-    records_written = 0
-    duplicates_added = 0
-    nulls_added = 0
-
-    with open(output_file, "w", newline="") as f:
-        writer = csv.writer(f)
-
-        # Write header
-        writer.writerow(
-            [
-                "transaction_id",
-                "date",
-                "region",
-                "product",
-                "quantity",
-                "price",
-                "customer_id",
-            ]
-        )
+    # Generate all columns as bulk NumPy arrays - no per-row Python loop
+    rng = np.random.default_rng()
+    n = num_records
+
+    transaction_ids = np.char.mod("TXN%08d", np.arange(n))
+
+    # Add some randomness to date (within same day)
+    day_start = np.datetime64(target_date.strftime("%Y-%m-%d"))
+    offsets = rng.integers(0, 24, n) * 3600 + rng.integers(0, 60, n) * 60
+    dates = day_start.astype("datetime64[s]") + offsets
+    date_strings = np.char.replace(dates.astype(str), "T", " ")
+
+    df = pd.DataFrame(
+        {
+            "transaction_id": transaction_ids,
+            "date": date_strings,
+            "region": rng.choice(regions, size=n),
+            "product": rng.choice(products, size=n),
+            "quantity": rng.integers(1, 51, n),
+            "price": rng.uniform(10.99, 999.99, n).round(2),
+            "customer_id": np.char.mod("CUST%04d", rng.integers(1000, 10000, n)),
+        }
+    )
 
-        # Generate records
-        for i in range(num_records):
-            # Add some randomness to date (within same day)
-            record_date = target_date + timedelta(
-                hours=random.randint(0, 23), minutes=random.randint(0, 59)
-            )
-
-            # Generate base record
-            transaction_id = f"TXN{i:08d}"
-            region = random.choice(regions)
-            product = random.choice(products)
-            quantity = random.randint(1, 50)
-            price = round(random.uniform(10.99, 999.99), 2)
-            customer_id = f"CUST{random.randint(1000, 9999)}"
-
-            # Intentionally add some data quality issues for validation testing
-            # ~2% duplicates
-            if random.random() < 0.02 and i > 100:
-                transaction_id = f"TXN{random.randint(0, i-1):08d}"
-                duplicates_added += 1
-
-            # ~1% null values in non-critical fields
-            if random.random() < 0.01:
-                customer_id = ""
-                nulls_added += 1
-
-            # Write record
-            writer.writerow(
-                [
-                    transaction_id,
-                    record_date.strftime("%Y-%m-%d %H:%M:%S"),
-                    region,
-                    product,
-                    quantity,
-                    price,
-                    customer_id,
-                ]
-            )
-
-            records_written += 1
-
-            # Progress indicator
-            if (i + 1) % 10000 == 0:
-                print(f"  ✓ Generated {i + 1:,} records...")
+    # Intentionally add some data quality issues for validation testing
+    # ~2% duplicates (re-point a record at an earlier transaction id)
+    dup_mask = rng.random(n) < 0.02
+    dup_mask[:101] = False
+    dup_idx = np.flatnonzero(dup_mask)
+    earlier = (rng.random(dup_idx.size) * dup_idx).astype(np.int64)
+    df.loc[dup_idx, "transaction_id"] = np.char.mod("TXN%08d", earlier)
+    duplicates_added = int(dup_mask.sum())
+
+    # ~1% null values in non-critical fields
+    null_mask = rng.random(n) < 0.01
+    df.loc[null_mask, "customer_id"] = ""
+    nulls_added = int(null_mask.sum())
+
+    # Columnar output: typed + compressed Parquet is 4-8x smaller on disk
+    # and skips text re-parsing downstream. CSV stays the default since
+    # the raw zone is still ingested as CSV.
+    if output_file.endswith(".parquet"):
+        df.to_parquet(
+            output_file,
+            engine="pyarrow",
+            compression="zstd",
+            row_group_size=100_000,
+            index=False,
+        )
+    else:
+        df.to_csv(output_file, index=False)
+    records_written = n
 
     # Summary
     print(f"\n✅ Generation Complete!")
@@ -155,7 +144,8 @@ if __name__ == "__main__":
     parser.add_argument(
         "--output",
         default="test_sales.csv",
-        help="Output CSV filename (default: test_sales.csv)",
+        help="Output filename; .parquet extension writes Parquet "
+        "(default: test_sales.csv)",
     )
     parser.add_argument(
         "--date", default=None, help="Date for records (YYYY-MM-DD, default: today)"
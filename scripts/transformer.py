@@ -12,15 +12,28 @@ Features:
 - Detailed transformation metrics
 """
 
+import argparse
+import gzip
 import sys
 import os
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict
 import pandas as pd
 import boto3
-from io import StringIO
+from boto3.s3.transfer import TransferConfig
+from io import BytesIO
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Optional vectorized SQL engine for the transform stage
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
 
 # Add config to path
 sys.path.append('/opt/capstone-pipeline/config')
@@ -42,6 +55,26 @@ logger = logging.getLogger(__name__)
 # Initialize S3 client
 s3_client = boto3.client('s3', region_name=config.AWS_REGION)
 
+# Multipart transfer settings: upload in parallel 16 MB parts once the
+# payload crosses 8 MB instead of one single-threaded put_object blob
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+
+def _csv_body(response):
+    """Return the object body as a readable stream, transparently
+    inflating gzip uploads. The validator's CSV fallback stores the
+    object compressed with ContentEncoding=gzip, which botocore does
+    not decode on GET - without this the parser sees raw gzip bytes."""
+    body = response['Body']
+    if response.get('ContentEncoding') == 'gzip':
+        return gzip.GzipFile(fileobj=body)
+    return body
+
 
 class DataTransformer:
     """Transforms and enriches validated sales data"""
@@ -60,6 +93,16 @@ class DataTransformer:
         'Cable': 'Accessories'
     }
     
+    # Calendar name lookup tables (indexed by month-1 / dayofweek)
+    MONTH_NAMES = np.array([
+        'January', 'February', 'March', 'April', 'May', 'June',
+        'July', 'August', 'September', 'October', 'November', 'December'
+    ])
+    DAY_NAMES = np.array([
+        'Monday', 'Tuesday', 'Wednesday', 'Thursday',
+        'Friday', 'Saturday', 'Sunday'
+    ])
+
     # Revenue tier thresholds
     REVENUE_TIERS = {
         'Low': (0, 100),
@@ -79,14 +122,30 @@ class DataTransformer:
         }
     
     def read_from_s3(self, key: str) -> pd.DataFrame:
-        """Read CSV file from S3"""
+        """Read CSV or Parquet file from S3 (dispatched on key suffix)"""
         try:
             logger.info(f"Reading file: s3://{self.bucket_name}/{key}")
-            
+
             response = s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            
-            df = pd.read_csv(StringIO(content))
+
+            if key.endswith('.parquet'):
+                # Typed columnar read - no text parsing at all
+                df = pd.read_parquet(BytesIO(response['Body'].read()))
+            else:
+                # Feed the binary StreamingBody straight to the multithreaded
+                # pyarrow parser - no full-file decode('utf-8') copy in
+                # between. Low-cardinality string columns come back as
+                # category so the groupby/map stages work on int8 codes,
+                # not boxed strings.
+                df = pd.read_csv(
+                    _csv_body(response),
+                    engine='pyarrow',
+                    dtype={
+                        'region': 'category',
+                        'product': 'category',
+                        'customer_id': 'category'
+                    }
+                )
             logger.info(f"Successfully read {len(df)} records")
             
             return df
@@ -99,14 +158,23 @@ class DataTransformer:
         """Write DataFrame to S3 as CSV"""
         try:
             logger.info(f"Writing {len(df)} records to s3://{self.bucket_name}/{key}")
-            
-            csv_buffer = StringIO()
-            df.to_csv(csv_buffer, index=False)
-            
-            s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=csv_buffer.getvalue()
+
+            # Serialize via Arrow's C++ writers instead of df.to_csv into
+            # a StringIO - avoids a full in-memory text copy of the frame.
+            # Parquet + zstd additionally shrinks the S3 payload 4-8x.
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            buffer = BytesIO()
+            if key.endswith('.parquet'):
+                pq.write_table(table, buffer, compression='zstd')
+            else:
+                pacsv.write_csv(table, buffer)
+
+            buffer.seek(0)
+            s3_client.upload_fileobj(
+                buffer,
+                self.bucket_name,
+                key,
+                Config=S3_TRANSFER_CONFIG
             )
             
             logger.info(f"Successfully wrote enriched data to S3")
@@ -119,8 +187,11 @@ class DataTransformer:
         """Calculate revenue = quantity × price"""
         logger.info("Calculating revenue...")
         
-        df['revenue'] = df['quantity'] * df['price']
-        df['revenue'] = df['revenue'].round(2)
+        # Multiply and round on the raw arrays - .round() on a Series
+        # would allocate a second full-size float column
+        quantity = df['quantity'].to_numpy()
+        price = df['price'].to_numpy()
+        df['revenue'] = np.round(quantity * price, 2)
         
         self.metrics['total_revenue'] = df['revenue'].sum()
         self.metrics['avg_revenue'] = df['revenue'].mean()
@@ -137,20 +208,25 @@ class DataTransformer:
         # Convert to datetime for extraction
         df['date'] = pd.to_datetime(df['date'])
         
-        # Extract components
-        df['year'] = df['date'].dt.year
-        df['month'] = df['date'].dt.month
-        df['month_name'] = df['date'].dt.strftime('%B')
-        df['quarter'] = df['date'].dt.quarter
-        df['day_of_week'] = df['date'].dt.dayofweek  # 0=Monday, 6=Sunday
-        df['day_name'] = df['date'].dt.strftime('%A')
-        df['week_of_year'] = df['date'].dt.isocalendar().week
-        
+        # Extract components; month/day names come from small lookup
+        # tables indexed by the numeric component instead of a per-row
+        # strftime call
+        # (narrow integer dtypes: the components all fit in int8/int16,
+        # which shrinks the output file and downstream scans)
+        df['year'] = df['date'].dt.year.astype('int16')
+        df['month'] = df['date'].dt.month.astype('int8')
+        df['month_name'] = self.MONTH_NAMES[df['month'].to_numpy() - 1]
+        df['quarter'] = df['date'].dt.quarter.astype('int8')
+        df['day_of_week'] = df['date'].dt.dayofweek.astype('int8')  # 0=Monday, 6=Sunday
+        df['day_name'] = self.DAY_NAMES[df['day_of_week'].to_numpy()]
+        df['week_of_year'] = df['date'].dt.isocalendar().week.astype('int16')
+
         # Add business day flag (True for Mon-Fri)
         df['is_business_day'] = df['day_of_week'] < 5
-        
-        # Convert date back to string for consistency
-        df['date'] = df['date'].dt.strftime('%Y-%m-%d')
+
+        # Convert date back to string for consistency - one C-level
+        # cast to day precision instead of per-row strftime
+        df['date'] = df['date'].to_numpy().astype('datetime64[D]').astype(str)
         
         logger.info("Date components extracted successfully")
         
@@ -159,21 +235,28 @@ class DataTransformer:
     def categorize_revenue(self, df: pd.DataFrame) -> pd.DataFrame:
         """Categorize transactions by revenue tier"""
         logger.info("Categorizing revenue...")
+
+        # Single C-level binary search into the tier boundaries; codes
+        # index straight into the label set (pd.cut would re-check bins
+        # and materialize labels on every call)
+        revenue = df['revenue'].to_numpy()
+        tier_bins = np.array([
+            upper for _, upper in self.REVENUE_TIERS.values()
+        ][:-1])
+        codes = np.searchsorted(tier_bins, revenue, side='right')
+        codes[np.isnan(revenue)] = -1
+        df['revenue_category'] = pd.Categorical.from_codes(
+            codes, list(self.REVENUE_TIERS.keys())
+        )
         
-        def get_revenue_category(revenue):
-            for category, (min_val, max_val) in self.REVENUE_TIERS.items():
-                if min_val <= revenue < max_val:
-                    return category
-            return 'Premium'  # Fallback
-        
-        df['revenue_category'] = df['revenue'].apply(get_revenue_category)
-        
-        # Log distribution
-        category_dist = df['revenue_category'].value_counts()
-        logger.info("Revenue category distribution:")
-        for category, count in category_dist.items():
-            pct = (count / len(df)) * 100
-            logger.info(f"  {category}: {count:,} ({pct:.1f}%)")
+        # Log distribution (debug only - the value_counts scan exists
+        # purely for this output)
+        if logger.isEnabledFor(logging.DEBUG):
+            category_dist = df['revenue_category'].value_counts()
+            logger.debug("Revenue category distribution:")
+            for category, count in category_dist.items():
+                pct = (count / len(df)) * 100
+                logger.debug(f"  {category}: {count:,} ({pct:.1f}%)")
         
         return df
     
@@ -181,126 +264,293 @@ class DataTransformer:
         """Map products to categories"""
         logger.info("Adding product categories...")
         
-        df['product_category'] = df['product'].map(self.PRODUCT_CATEGORIES)
-        
+        if df['product'].dtype.name == 'category':
+            # One dict lookup per unique product, then a pure C-level
+            # take over the codes - zero per-row Python work
+            labels = np.array([
+                self.PRODUCT_CATEGORIES.get(product, 'Other')
+                for product in df['product'].cat.categories
+            ])
+            codes = df['product'].cat.codes.to_numpy()
+            values = labels[codes]
+            values[codes == -1] = 'Other'  # missing product
+            df['product_category'] = pd.Categorical(values)
+        else:
+            # Single fused expression: map, default unmapped to 'Other'
+            # and store as category - one pass, no separate fillna scan
+            df['product_category'] = (
+                df['product']
+                .map(self.PRODUCT_CATEGORIES)
+                .fillna('Other')
+                .astype('category')
+            )
+
         # Handle unmapped products (if any)
-        unmapped = df['product_category'].isna().sum()
+        unmapped = (df['product_category'] == 'Other').sum()
         if unmapped > 0:
             logger.warning(f"Found {unmapped} products without category mapping")
-            df['product_category'].fillna('Other', inplace=True)
         
-        # Log distribution
-        category_dist = df['product_category'].value_counts()
-        logger.info("Product category distribution:")
-        for category, count in category_dist.items():
-            pct = (count / len(df)) * 100
-            logger.info(f"  {category}: {count:,} ({pct:.1f}%)")
+        # Log distribution (debug only)
+        if logger.isEnabledFor(logging.DEBUG):
+            category_dist = df['product_category'].value_counts()
+            logger.debug("Product category distribution:")
+            for category, count in category_dist.items():
+                pct = (count / len(df)) * 100
+                logger.debug(f"  {category}: {count:,} ({pct:.1f}%)")
         
         return df
     
+    @staticmethod
+    def _grouped_pct_ranks(codes: np.ndarray, columns: list) -> list:
+        """Percentile ranks (pandas 'average' method) of several columns
+        within the groups given by codes, sharing a single partition
+        sort instead of one full sort per rank call"""
+        if codes.size == 0:
+            # zero-row frame (e.g. an all-invalid day): no groups at all
+            return [np.empty(0, dtype=np.float64) for _ in columns]
+
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [codes.size]))
+
+        results = []
+        for values in columns:
+            out = np.empty(values.shape, dtype=np.float64)
+            sorted_vals = values[order]
+            for start, end in zip(starts, ends):
+                idx = order[start:end]
+                if sorted_codes[start] == -1:  # null group key
+                    out[idx] = np.nan
+                    continue
+                vals = sorted_vals[start:end]
+                n = vals.size
+                o = np.argsort(vals, kind='stable')
+                sv = vals[o]
+                tie_bounds = np.flatnonzero(np.diff(sv)) + 1
+                tie_starts = np.concatenate(([0], tie_bounds))
+                tie_ends = np.concatenate((tie_bounds, [n]))
+                # average rank of a tie run start+1..end is (start+1+end)/2
+                avg_ranks = (tie_starts + tie_ends + 1) / 2.0
+                ranks = np.empty(n)
+                ranks[o] = np.repeat(avg_ranks, tie_ends - tie_starts)
+                out[idx] = ranks / n
+            results.append(out)
+        return results
+
+    @staticmethod
+    def _bucket_customers(totals: np.ndarray) -> pd.Categorical:
+        """Bucket per-customer revenue totals into segment labels,
+        keeping NaN totals (missing customer_id) as missing"""
+        codes = np.searchsorted([500.0, 2000.0, 5000.0], totals, side='right')
+        codes[np.isnan(totals)] = -1
+        return pd.Categorical.from_codes(
+            codes, ['Bronze', 'Silver', 'Gold', 'Platinum']
+        )
+
     def add_customer_segments(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Segment customers based on purchase behavior"""
+        """Segment customers based on purchase behavior.
+
+        Reads the shared frame, returns only the new column so it can
+        run concurrently with the other enrichment methods."""
         logger.info("Adding customer segments...")
-        
-        # Calculate per-customer metrics
-        customer_stats = df.groupby('customer_id').agg({
-            'revenue': 'sum',
-            'transaction_id': 'count'
-        }).rename(columns={'transaction_id': 'purchase_count'})
-        
-        # Define segments based on total revenue
-        def get_customer_segment(total_revenue):
-            if total_revenue < 500:
-                return 'Bronze'
-            elif total_revenue < 2000:
-                return 'Silver'
-            elif total_revenue < 5000:
-                return 'Gold'
-            else:
-                return 'Platinum'
-        
-        customer_stats['customer_segment'] = customer_stats['revenue'].apply(
-            get_customer_segment
-        )
-        
-        # Merge back to main dataframe
-        df = df.merge(
-            customer_stats[['customer_segment']], 
-            left_on='customer_id', 
-            right_index=True, 
-            how='left'
+
+        # Broadcast each customer's total revenue straight back per-row -
+        # no intermediate stats frame and no hash join over the full frame
+        customer_totals = df.groupby(
+            'customer_id', sort=False, observed=True
+        )['revenue'].transform('sum')
+
+        # Define segments based on total revenue (binary search into
+        # the threshold array)
+        out = pd.DataFrame(
+            {'customer_segment': self._bucket_customers(customer_totals.to_numpy())},
+            index=df.index
         )
-        
-        # Log distribution
-        segment_dist = df['customer_segment'].value_counts()
-        logger.info("Customer segment distribution:")
-        for segment, count in segment_dist.items():
-            pct = (count / len(df)) * 100
-            logger.info(f"  {segment}: {count:,} ({pct:.1f}%)")
-        
-        return df
+
+        # Log distribution (debug only)
+        if logger.isEnabledFor(logging.DEBUG):
+            segment_dist = out['customer_segment'].value_counts()
+            logger.debug("Customer segment distribution:")
+            for segment, count in segment_dist.items():
+                pct = (count / len(df)) * 100
+                logger.debug(f"  {segment}: {count:,} ({pct:.1f}%)")
+
+        return out
     
-    def add_price_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add price analysis indicators"""
+    def add_price_indicators(self, df: pd.DataFrame, price_percentile: np.ndarray) -> pd.DataFrame:
+        """Add price analysis indicators (returns only the new columns)"""
         logger.info("Adding price indicators...")
-        
-        # Calculate price percentile for each product
-        df['price_percentile'] = df.groupby('product')['price'].rank(pct=True)
-        
+
+        out = pd.DataFrame(index=df.index)
+
+        # Price percentile for each product (precomputed alongside the
+        # quantity percentile from one shared partition sort)
+        out['price_percentile'] = price_percentile
+
         # Flag high-value transactions (top 10% by revenue)
         revenue_90th = df['revenue'].quantile(0.9)
-        df['is_high_value'] = df['revenue'] >= revenue_90th
-        
-        high_value_count = df['is_high_value'].sum()
+        out['is_high_value'] = df['revenue'] >= revenue_90th
+
+        high_value_count = out['is_high_value'].sum()
         logger.info(f"High-value transactions: {high_value_count:,} "
                    f"({(high_value_count/len(df)*100):.1f}%)")
-        
-        return df
+
+        return out
     
-    def add_quantity_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add quantity-based indicators"""
+    def add_quantity_indicators(self, df: pd.DataFrame, gb_product,
+                                quantity_percentile: np.ndarray) -> pd.DataFrame:
+        """Add quantity-based indicators (returns only the new columns)"""
         logger.info("Adding quantity indicators...")
-        
+
+        out = pd.DataFrame(index=df.index)
+
         # Flag bulk purchases (quantity > median for that product)
-        product_medians = df.groupby('product')['quantity'].transform('median')
-        df['is_bulk_purchase'] = df['quantity'] > product_medians
-        
-        # Calculate quantity percentile
-        df['quantity_percentile'] = df.groupby('product')['quantity'].rank(pct=True)
-        
-        bulk_count = df['is_bulk_purchase'].sum()
+        product_medians = gb_product['quantity'].transform('median')
+        out['is_bulk_purchase'] = df['quantity'] > product_medians
+
+        # Quantity percentile (from the shared partition sort)
+        out['quantity_percentile'] = quantity_percentile
+
+        bulk_count = out['is_bulk_purchase'].sum()
         logger.info(f"Bulk purchases: {bulk_count:,} "
                    f"({(bulk_count/len(df)*100):.1f}%)")
-        
-        return df
+
+        return out
     
-    def add_regional_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add region-based analysis"""
+    def add_regional_indicators(self, df: pd.DataFrame, gb_region) -> pd.DataFrame:
+        """Add region-based analysis (returns only the new columns)"""
         logger.info("Adding regional indicators...")
-        
-        # Calculate regional averages
-        regional_avg = df.groupby('region')['revenue'].transform('mean')
-        df['regional_avg_revenue'] = regional_avg.round(2)
-        
+
+        out = pd.DataFrame(index=df.index)
+
+        # Calculate regional averages, rounding on the raw array rather
+        # than allocating another Series via .round()
+        regional_avg = gb_region['revenue'].transform('mean')
+        out['regional_avg_revenue'] = np.round(regional_avg.to_numpy(), 2)
+
         # Flag if transaction is above regional average
-        df['above_regional_avg'] = df['revenue'] > df['regional_avg_revenue']
-        
-        # Log regional performance
-        regional_stats = df.groupby('region')['revenue'].agg(['sum', 'mean', 'count'])
-        logger.info("Regional performance:")
-        for region in regional_stats.index:
-            total = regional_stats.loc[region, 'sum']
-            avg = regional_stats.loc[region, 'mean']
-            count = regional_stats.loc[region, 'count']
-            logger.info(f"  {region}: {count:,} txns, "
-                       f"${total:,.2f} total, ${avg:.2f} avg")
-        
-        return df
+        out['above_regional_avg'] = df['revenue'] > out['regional_avg_revenue']
+
+        # Log regional performance (debug only - the agg pass exists
+        # purely for this output)
+        if logger.isEnabledFor(logging.DEBUG):
+            regional_stats = gb_region['revenue'].agg(['sum', 'mean', 'count'])
+            logger.debug("Regional performance:")
+            for region in regional_stats.index:
+                total = regional_stats.loc[region, 'sum']
+                avg = regional_stats.loc[region, 'mean']
+                count = regional_stats.loc[region, 'count']
+                logger.debug(f"  {region}: {count:,} txns, "
+                            f"${total:,.2f} total, ${avg:.2f} avg")
+
+        return out
     
+    def transform_data_sql(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply all transformations as one DuckDB query
+
+        The whole enrichment is relational (arithmetic, CASE buckets,
+        windowed aggregates), so a single SQL statement runs it in
+        DuckDB's parallel vectorized engine in one pass instead of
+        eight pandas passes over the frame."""
+        logger.info("Starting transformation pipeline (DuckDB)...")
+
+        initial_columns = len(df.columns)
+
+        product_cases = ' '.join(
+            f"WHEN '{product}' THEN '{category}'"
+            for product, category in self.PRODUCT_CATEGORIES.items()
+        )
+        tier_cases = ' '.join(
+            f"WHEN revenue < {upper} THEN '{tier}'"
+            for tier, (_, upper) in self.REVENUE_TIERS.items()
+            if upper != float('inf')
+        )
+
+        # _row pins the original row order across the window shuffles
+        work = df.assign(_row=np.arange(len(df)))
+        con = duckdb.connect()
+        con.register('sales', work)
+
+        sql = f"""
+            WITH base AS (
+                SELECT *,
+                       ROUND(quantity * price, 2) AS revenue,
+                       CAST(date AS TIMESTAMP) AS ts
+                FROM sales
+            ),
+            cutoff AS (
+                SELECT QUANTILE_CONT(revenue, 0.9) AS revenue_90th FROM base
+            )
+            SELECT
+                transaction_id,
+                STRFTIME(ts, '%Y-%m-%d') AS date,
+                region,
+                product,
+                quantity,
+                price,
+                customer_id,
+                revenue,
+                YEAR(ts) AS year,
+                MONTH(ts) AS month,
+                MONTHNAME(ts) AS month_name,
+                QUARTER(ts) AS quarter,
+                ISODOW(ts) - 1 AS day_of_week,
+                DAYNAME(ts) AS day_name,
+                WEEKOFYEAR(ts) AS week_of_year,
+                ISODOW(ts) <= 5 AS is_business_day,
+                CASE {tier_cases} ELSE 'Premium' END AS revenue_category,
+                CASE product {product_cases} ELSE 'Other' END AS product_category,
+                CASE
+                    WHEN customer_id IS NULL THEN NULL
+                    WHEN SUM(revenue) OVER w_cust < 500 THEN 'Bronze'
+                    WHEN SUM(revenue) OVER w_cust < 2000 THEN 'Silver'
+                    WHEN SUM(revenue) OVER w_cust < 5000 THEN 'Gold'
+                    ELSE 'Platinum'
+                END AS customer_segment,
+                (RANK() OVER (PARTITION BY product ORDER BY price)
+                    + (COUNT(*) OVER (PARTITION BY product, price) - 1) / 2.0)
+                    / COUNT(*) OVER w_prod AS price_percentile,
+                revenue >= (SELECT revenue_90th FROM cutoff) AS is_high_value,
+                quantity > MEDIAN(quantity) OVER w_prod AS is_bulk_purchase,
+                (RANK() OVER (PARTITION BY product ORDER BY quantity)
+                    + (COUNT(*) OVER (PARTITION BY product, quantity) - 1) / 2.0)
+                    / COUNT(*) OVER w_prod AS quantity_percentile,
+                ROUND(AVG(revenue) OVER w_region, 2) AS regional_avg_revenue,
+                revenue > ROUND(AVG(revenue) OVER w_region, 2) AS above_regional_avg
+            FROM base
+            WINDOW
+                w_prod AS (PARTITION BY product),
+                w_region AS (PARTITION BY region),
+                w_cust AS (PARTITION BY customer_id)
+            ORDER BY _row
+        """
+
+        df = con.execute(sql).arrow().read_pandas()
+
+        self.metrics['total_revenue'] = df['revenue'].sum()
+        self.metrics['avg_revenue'] = df['revenue'].mean()
+        self.metrics['columns_added'] = len(df.columns) - initial_columns
+        self.metrics['records_processed'] = len(df)
+
+        logger.info(f"Transformation complete: {initial_columns} → {len(df.columns)} columns "
+                   f"({self.metrics['columns_added']} added)")
+
+        return df
+
     def transform_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply all transformations"""
+        # Push the whole enrichment into DuckDB when it is available;
+        # the pandas pipeline below remains the fallback (and serves
+        # the chunked streaming path). Zero-row frames skip SQL: an
+        # empty categorical region maps to an ENUM with no values,
+        # which DuckDB rejects.
+        if duckdb is not None and not df.empty:
+            return self.transform_data_sql(df)
+
         logger.info("Starting transformation pipeline...")
-        
+
         initial_columns = len(df.columns)
         
         # Apply transformations
@@ -308,10 +558,37 @@ class DataTransformer:
         df = self.extract_date_components(df)
         df = self.categorize_revenue(df)
         df = self.add_product_categories(df)
-        df = self.add_customer_segments(df)
-        df = self.add_price_indicators(df)
-        df = self.add_quantity_indicators(df)
-        df = self.add_regional_indicators(df)
+
+        # Group once and reuse - the indicator methods issue several
+        # operations against the same keys, so re-hashing per method
+        # would rescan the full frame each time. Categorical keys group
+        # on integer codes instead of Python strings.
+        for col in ('product', 'region'):
+            if df[col].dtype.name != 'category':
+                df[col] = df[col].astype('category')
+        gb_product = df.groupby('product', sort=False, observed=True)
+        gb_region = df.groupby('region', sort=False, observed=True)
+
+        # Both percentile columns come out of one partition sort
+        price_pct, quantity_pct = self._grouped_pct_ranks(
+            df['product'].cat.codes.to_numpy(),
+            [df['price'].to_numpy(), df['quantity'].to_numpy()]
+        )
+
+        # The four remaining enrichment methods are independent of each
+        # other and only read the shared frame, so run them on a thread
+        # pool (the GIL is released inside the pandas/NumPy kernels) and
+        # splice their columns back in one concat
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(self.add_customer_segments, df),
+                pool.submit(self.add_price_indicators, df, price_pct),
+                pool.submit(self.add_quantity_indicators, df, gb_product, quantity_pct),
+                pool.submit(self.add_regional_indicators, df, gb_region)
+            ]
+            new_columns = [future.result() for future in futures]
+
+        df = pd.concat([df] + new_columns, axis=1)
         
         final_columns = len(df.columns)
         self.metrics['columns_added'] = final_columns - initial_columns
@@ -322,12 +599,211 @@ class DataTransformer:
         
         return df
     
+    def _compute_global_stats(self, input_key: str) -> Dict:
+        """Pass 1 of the streaming path: read only the numeric/grouping
+        columns and derive every cross-row statistic (ranks, medians,
+        group means, customer totals) as per-row arrays, so pass 2 can
+        enrich each chunk independently."""
+        logger.info("Computing global statistics (pass 1)...")
+
+        core_columns = ['region', 'product', 'quantity', 'price', 'customer_id']
+        response = s3_client.get_object(Bucket=self.bucket_name, Key=input_key)
+        if input_key.endswith('.parquet'):
+            core = pd.read_parquet(
+                BytesIO(response['Body'].read()),
+                columns=core_columns
+            )
+            # Only region is dictionary-encoded on disk; the other
+            # grouping columns still need their category cast
+            for col in ('product', 'customer_id'):
+                if not isinstance(core[col].dtype, pd.CategoricalDtype):
+                    core[col] = core[col].astype('category')
+        else:
+            core = pd.read_csv(
+                _csv_body(response),
+                engine='pyarrow',
+                usecols=core_columns,
+                dtype={
+                    'region': 'category',
+                    'product': 'category',
+                    'customer_id': 'category'
+                }
+            )
+
+        if core.empty:
+            # Nothing to aggregate: pass 2 will emit a schema-only file
+            return {
+                'revenue_90th': np.nan,
+                'price_percentile': np.empty(0),
+                'quantity_percentile': np.empty(0),
+                'product_median_quantity': np.empty(0),
+                'regional_avg_revenue': np.empty(0),
+                'customer_total_revenue': np.empty(0)
+            }
+
+        revenue = np.round(core['quantity'].to_numpy() * core['price'].to_numpy(), 2)
+        core['revenue'] = revenue
+
+        gb_product = core.groupby('product', sort=False, observed=True)
+        gb_region = core.groupby('region', sort=False, observed=True)
+        gb_customer = core.groupby('customer_id', sort=False, observed=True)
+
+        price_pct, quantity_pct = self._grouped_pct_ranks(
+            core['product'].cat.codes.to_numpy(),
+            [core['price'].to_numpy(), core['quantity'].to_numpy()]
+        )
+
+        stats = {
+            'revenue_90th': np.quantile(revenue, 0.9),
+            'price_percentile': price_pct,
+            'quantity_percentile': quantity_pct,
+            'product_median_quantity': gb_product['quantity'].transform('median').to_numpy(),
+            'regional_avg_revenue': np.round(gb_region['revenue'].transform('mean').to_numpy(), 2),
+            'customer_total_revenue': gb_customer['revenue'].transform('sum').to_numpy()
+        }
+
+        self.metrics['total_revenue'] = revenue.sum()
+        self.metrics['avg_revenue'] = revenue.mean()
+
+        logger.info(f"Global statistics ready for {len(core)} records")
+        return stats
+
+    def _enrich_chunk(self, chunk: pd.DataFrame, stats: Dict, offset: int) -> pd.DataFrame:
+        """Pass 2 worker: apply the row-local transforms to one chunk and
+        splice in the per-row arrays computed during pass 1."""
+        rows = slice(offset, offset + len(chunk))
+
+        chunk['revenue'] = np.round(
+            chunk['quantity'].to_numpy() * chunk['price'].to_numpy(), 2
+        )
+        chunk = self.extract_date_components(chunk)
+        chunk = self.categorize_revenue(chunk)
+        chunk = self.add_product_categories(chunk)
+
+        chunk['customer_segment'] = self._bucket_customers(
+            stats['customer_total_revenue'][rows]
+        )
+        chunk['price_percentile'] = stats['price_percentile'][rows]
+        chunk['is_high_value'] = chunk['revenue'] >= stats['revenue_90th']
+        chunk['is_bulk_purchase'] = (
+            chunk['quantity'].to_numpy() > stats['product_median_quantity'][rows]
+        )
+        chunk['quantity_percentile'] = stats['quantity_percentile'][rows]
+        chunk['regional_avg_revenue'] = stats['regional_avg_revenue'][rows]
+        chunk['above_regional_avg'] = (
+            chunk['revenue'].to_numpy() > stats['regional_avg_revenue'][rows]
+        )
+
+        return chunk
+
+    def process_file_chunked(self, input_key: str, output_key: str) -> Dict:
+        """Streaming transformation pipeline: two passes over the input,
+        O(chunk) peak memory instead of O(file)"""
+        try:
+            logger.info(f"Starting chunked transformation for {input_key}")
+            start_time = datetime.now()
+
+            stats = self._compute_global_stats(input_key)
+
+            response = s3_client.get_object(Bucket=self.bucket_name, Key=input_key)
+            if input_key.endswith('.parquet'):
+                # Decode row-group batches one at a time; only the
+                # compressed bytes are held whole, never the decoded
+                # frame plus its 18 derived columns
+                parquet_file = pq.ParquetFile(BytesIO(response['Body'].read()))
+                reader = (batch.to_pandas() for batch in
+                          parquet_file.iter_batches(batch_size=config.CHUNK_SIZE))
+            else:
+                reader = pd.read_csv(
+                    _csv_body(response),
+                    chunksize=config.CHUNK_SIZE,
+                    dtype={
+                        'region': 'category',
+                        'product': 'category',
+                        'customer_id': 'category'
+                    }
+                )
+
+            buffer = BytesIO()
+            writer = None
+            offset = 0
+            columns_added = 0
+
+            for chunk in reader:
+                # a header-only CSV yields one empty chunk with untyped
+                # columns; let the schema-only fallback below handle it
+                if chunk.empty:
+                    continue
+                initial_columns = len(chunk.columns)
+                chunk = self._enrich_chunk(chunk, stats, offset)
+                offset += len(chunk)
+                columns_added = len(chunk.columns) - initial_columns
+
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(buffer, table.schema, compression='zstd')
+                elif table.schema != writer.schema:
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+
+            if writer is not None:
+                writer.close()
+            else:
+                # Zero data rows: enrich an empty typed frame so the
+                # upload is a readable, schema-only Parquet rather than
+                # a 0-byte object downstream readers reject
+                if input_key.endswith('.parquet'):
+                    empty = parquet_file.schema_arrow.empty_table().to_pandas()
+                else:
+                    empty = pd.DataFrame({
+                        col: pd.Series(dtype=dtype)
+                        for col, dtype in config.EXPECTED_DTYPES.items()
+                    })
+                initial_columns = len(empty.columns)
+                empty = self.transform_data(empty)
+                columns_added = len(empty.columns) - initial_columns
+                pq.write_table(pa.Table.from_pandas(empty, preserve_index=False),
+                               buffer, compression='zstd')
+
+            logger.info(f"Writing {offset} records to s3://{self.bucket_name}/{output_key}")
+            buffer.seek(0)
+            s3_client.upload_fileobj(
+                buffer,
+                self.bucket_name,
+                output_key,
+                Config=S3_TRANSFER_CONFIG
+            )
+
+            self.metrics['records_processed'] = offset
+            self.metrics['columns_added'] = columns_added
+
+            processing_time = (datetime.now() - start_time).total_seconds()
+            self.metrics['transformation_time'] = processing_time
+
+            logger.info(f"Chunked transformation completed in {processing_time:.2f} seconds")
+
+            return self.metrics
+
+        except Exception as e:
+            logger.error(f"Chunked transformation pipeline failed: {str(e)}")
+            raise
+
     def process_file(self, input_key: str, output_key: str) -> Dict:
         """Main transformation pipeline"""
         try:
             logger.info(f"Starting transformation for {input_key}")
             start_time = datetime.now()
-            
+
+            # Stream very large inputs (CSV or Parquet) in chunks instead
+            # of loading the whole file (and its 18 derived columns) into
+            # memory; the chunked writer always emits Parquet
+            if output_key.endswith('.parquet'):
+                size = s3_client.head_object(
+                    Bucket=self.bucket_name, Key=input_key
+                )['ContentLength']
+                if size > config.STREAMING_THRESHOLD_MB * 1024 * 1024:
+                    return self.process_file_chunked(input_key, output_key)
+
             # Read validated data
             df = self.read_from_s3(input_key)
             
@@ -349,6 +825,29 @@ class DataTransformer:
             logger.error(f"Transformation pipeline failed: {str(e)}")
             raise
     
+    def process_files(self, keys) -> None:
+        """Process several (input_key, output_key) pairs back-to-back,
+        overlapping S3 I/O with compute: the next input is prefetched on
+        a background thread while the current frame transforms, and each
+        upload runs while the next file is already being read."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            read_future = pool.submit(self.read_from_s3, keys[0][0])
+            write_future = None
+
+            for i, (input_key, output_key) in enumerate(keys):
+                df = read_future.result()
+                if i + 1 < len(keys):
+                    read_future = pool.submit(self.read_from_s3, keys[i + 1][0])
+
+                df = self.transform_data(df)
+
+                if write_future is not None:
+                    write_future.result()
+                write_future = pool.submit(self.write_to_s3, df, output_key)
+                logger.info(f"Finished transforming {input_key}")
+
+            write_future.result()
+
     def print_metrics_summary(self):
         """Print transformation metrics"""
         logger.info("\n" + "="*60)
@@ -362,34 +861,71 @@ class DataTransformer:
         logger.info("="*60 + "\n")
 
 
+def _date_keys(date_str: str):
+    """S3 keys for one day: the processed zone is Parquet end to end
+    (validated input and enriched output, the latter overwriting)"""
+    input_key = f"{config.PROCESSED_ZONE}/{date_str}.parquet"
+    output_key = f"{config.PROCESSED_ZONE}/{date_str}.parquet"
+    return input_key, output_key
+
+
+def process_one_date(date_str: str) -> Dict:
+    """Transform a single day's file (also the process-pool worker entry)"""
+    input_key, output_key = _date_keys(date_str)
+
+    transformer = DataTransformer(config.S3_BUCKET)
+    metrics = transformer.process_file(input_key, output_key)
+    transformer.print_metrics_summary()
+    return metrics
+
+
+def _init_worker():
+    """Per-process setup: boto3 clients are not fork-safe, so each
+    worker builds a fresh one after the fork"""
+    global s3_client
+    s3_client = boto3.client('s3', region_name=config.AWS_REGION)
+
+
 def main():
     """Main execution function"""
-    
-    # Default to today's date if no argument provided
-    if len(sys.argv) > 1:
-        date_str = sys.argv[1]
+
+    parser = argparse.ArgumentParser(
+        description='Enrich validated sales data (single date or date range)'
+    )
+    parser.add_argument('date', nargs='?', default=None,
+                        help='Date to process (YYYY-MM-DD, default: today)')
+    parser.add_argument('--start', help='Start of date range (YYYY-MM-DD)')
+    parser.add_argument('--end', help='End of date range (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    if args.start and args.end:
+        dates = [d.strftime('%Y-%m-%d') for d in pd.date_range(args.start, args.end)]
     else:
-        date_str = datetime.now().strftime('%Y-%m-%d')
-    
-    logger.info(f"Processing date: {date_str}")
-    
-    # Define S3 keys (read and write to processed-zone)
-    input_key = f"{config.PROCESSED_ZONE}/{date_str}.csv"
-    output_key = f"{config.PROCESSED_ZONE}/{date_str}.csv"  # Overwrite
-    
+        dates = [args.date or datetime.now().strftime('%Y-%m-%d')]
+
     try:
-        # Initialize transformer
-        transformer = DataTransformer(config.S3_BUCKET)
-        
-        # Process file
-        metrics = transformer.process_file(input_key, output_key)
-        
-        # Print summary
-        transformer.print_metrics_summary()
-        
+        if len(dates) == 1:
+            logger.info(f"Processing date: {dates[0]}")
+            process_one_date(dates[0])
+        else:
+            # Each day is fully independent (own S3 keys, own frame), so
+            # backfills fan out across processes
+            workers = min(len(dates), os.cpu_count() or 1)
+            logger.info(f"Processing {len(dates)} dates "
+                       f"({dates[0]} → {dates[-1]}) with {workers} workers")
+            if workers == 1:
+                # No CPU headroom to fork - still overlap the network
+                # phases with compute via the pipelined path
+                transformer = DataTransformer(config.S3_BUCKET)
+                transformer.process_files([_date_keys(d) for d in dates])
+            else:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         initializer=_init_worker) as executor:
+                    list(executor.map(process_one_date, dates))
+
         logger.info("✅ Transformer completed successfully")
         return 0
-        
+
     except Exception as e:
         logger.error(f"❌ Transformer failed: {str(e)}")
         return 1
@@ -11,14 +11,30 @@ Features:
 - Detailed metrics logging
 """
 
+import argparse
+import gzip
 import sys
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from io import BytesIO
 from typing import Dict, Tuple
+import numpy as np
 import pandas as pd
 import boto3
-from io import StringIO
+from boto3.s3.transfer import TransferConfig
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+try:
+    import numba
+except ImportError:
+    # Optional: when available, the business-rule predicate is JIT-fused
+    # into one parallel loop instead of several boolean temporaries
+    numba = None
 
 # Add config to path
 sys.path.append('/opt/capstone-pipeline/config')
@@ -37,8 +53,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize S3 client
-s3_client = boto3.client('s3', region_name=config.AWS_REGION)
+# Large uploads go multipart with parallel part transfers
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
+# Region lookup tables built once at import instead of per rule check
+VALID_REGIONS = frozenset(config.VALID_REGIONS)
+VALID_REGIONS_ARROW = pa.array(config.VALID_REGIONS)
+
+# Schema of the validated output, for writing a readable (schema-only)
+# Parquet file when a day yields no valid rows at all
+VALIDATED_SCHEMA = pa.schema([
+    ('transaction_id', pa.large_string()),
+    ('date', pa.timestamp('ms')),
+    ('region', pa.dictionary(pa.int8(), pa.string())),
+    ('product', pa.large_string()),
+    ('quantity', pa.int32()),
+    ('price', pa.float64()),
+    ('customer_id', pa.large_string()),
+])
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _business_rules_jit(q, p, bad_region, survivors,
+                            min_q, max_q, min_p, max_p):
+        """Fused business-rule loop: one pass over the arrays produces
+        the keep mask and the per-rule violation counts without
+        materializing the intermediate boolean temporaries"""
+        n = q.shape[0]
+        keep = np.empty(n, np.bool_)
+        n_quantity = 0
+        n_price = 0
+        n_region = 0
+        for i in numba.prange(n):
+            bad_q = (q[i] < min_q) or (q[i] > max_q)
+            bad_p = (p[i] < min_p) or (p[i] > max_p)
+            bad_r = bad_region[i]
+            alive = survivors[i]
+            n_quantity += alive and bad_q
+            n_price += alive and bad_p
+            n_region += alive and bad_r
+            keep[i] = alive and not (bad_q or bad_p or bad_r)
+        return keep, n_quantity, n_price, n_region
+
+
+class _SeenIds:
+    """Cross-chunk store of accepted transaction IDs for the streaming
+    path: IDs accumulate as Arrow string chunks (a fraction of the
+    footprint of a Python set of str) and membership is tested by a
+    C-level pc.is_in over the whole collection"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def contains(self, ids: pd.Series) -> np.ndarray:
+        """Boolean mask of IDs already accepted by an earlier chunk"""
+        if not self._chunks:
+            return np.zeros(len(ids), dtype=bool)
+        mask = pc.is_in(pa.array(ids), value_set=pa.chunked_array(self._chunks))
+        return pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+
+    def add(self, ids: np.ndarray) -> None:
+        """Record this chunk's first occurrences"""
+        if len(ids):
+            self._chunks.append(pa.array(ids))
 
 
 class DataValidator:
@@ -46,6 +129,15 @@ class DataValidator:
     
     def __init__(self, bucket_name: str):
         self.bucket_name = bucket_name
+        # boto3 clients are not fork-safe, and building one at import
+        # time blocks module load on credential resolution - each
+        # validator owns its client instead
+        self.s3_client = boto3.client('s3', region_name=config.AWS_REGION)
+        self._reset_metrics()
+
+    def _reset_metrics(self):
+        """Fresh per-file counters, so one validator instance (and its
+        warm S3 client/connection pool) can process many files"""
         self.metrics = {
             'total_records': 0,
             'valid_records': 0,
@@ -57,41 +149,73 @@ class DataValidator:
             'schema_errors': 0
         }
     
-    def read_from_s3(self, key: str) -> pd.DataFrame:
-        """Read CSV file from S3"""
+    def read_from_s3(self, key: str) -> pa.Table:
+        """Read CSV file from S3 as an Arrow table"""
         try:
-            logger.info(f"Reading file: s3://{self.bucket_name}/{key}")
-            
-            response = s3_client.get_object(Bucket=self.bucket_name, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            
-            df = pd.read_csv(StringIO(content))
-            logger.info(f"Successfully read {len(df)} records")
-            
-            return df
-            
+            logger.info("Reading file: s3://%s/%s", self.bucket_name, key)
+
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+
+            # Parse the binary StreamingBody directly with Arrow's
+            # multithreaded C++ reader - no full-file decode('utf-8')
+            # and no StringIO copy. Empty strings stay null so the
+            # null-handling stages see the same data pandas produced.
+            # Only the required columns are tokenized (a file missing
+            # one fails right here), and region dictionary-encodes at
+            # parse so it is born categorical.
+            table = pacsv.read_csv(
+                response['Body'],
+                read_options=pacsv.ReadOptions(block_size=8 << 20, use_threads=True),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=config.REQUIRED_COLUMNS,
+                    column_types={'region': pa.dictionary(pa.int32(), pa.string())},
+                    strings_can_be_null=True
+                )
+            )
+            logger.info("Successfully read %d records", table.num_rows)
+
+            return table
+
         except Exception as e:
-            logger.error(f"Failed to read from S3: {str(e)}")
+            logger.error("Failed to read from S3: %s", e)
             raise
     
     def write_to_s3(self, df: pd.DataFrame, key: str) -> None:
-        """Write DataFrame to S3 as CSV"""
+        """Write DataFrame to S3 as Parquet or CSV (dispatched on suffix)"""
         try:
-            logger.info(f"Writing {len(df)} records to s3://{self.bucket_name}/{key}")
-            
-            csv_buffer = StringIO()
-            df.to_csv(csv_buffer, index=False)
-            
-            s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=csv_buffer.getvalue()
+            logger.info("Writing %d records to s3://%s/%s", len(df), self.bucket_name, key)
+
+            # Serialize with Arrow's C++ writers straight into an
+            # in-memory buffer - skips the pandas text formatter and the
+            # extra StringIO copy. The processed zone is Parquet: typed
+            # columns, zstd compression and dictionary-encoded region,
+            # so the transformer loads it with zero re-parsing.
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            extra_args = {}
+            if key.endswith('.parquet'):
+                pq.write_table(table, sink, compression='zstd',
+                               use_dictionary=['region'])
+                payload = pa.BufferReader(sink.getvalue())
+            else:
+                # CSV fallback: gzip before upload (sales CSV shrinks
+                # several-fold), flagged so S3 clients decode it
+                pacsv.write_csv(table, sink)
+                payload = BytesIO(gzip.compress(sink.getvalue().to_pybytes()))
+                extra_args['ContentEncoding'] = 'gzip'
+
+            self.s3_client.upload_fileobj(
+                payload,
+                self.bucket_name,
+                key,
+                ExtraArgs=extra_args,
+                Config=S3_TRANSFER_CONFIG
             )
             
-            logger.info(f"Successfully wrote to S3")
+            logger.info("Successfully wrote to S3")
             
         except Exception as e:
-            logger.error(f"Failed to write to S3: {str(e)}")
+            logger.error("Failed to write to S3: %s", e)
             raise
     
     def validate_schema(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -104,142 +228,299 @@ class DataValidator:
             self.metrics['schema_errors'] += 1
             raise ValueError(f"Missing required columns: {missing_cols}")
         
-        # Select only required columns (ignore extras)
-        df = df[config.REQUIRED_COLUMNS].copy()
-        
+        # Select only required columns (ignore extras); copy-on-write
+        # makes the defensive .copy() redundant
+        df = df[config.REQUIRED_COLUMNS]
+
+        # Region has a handful of distinct values: categorical makes the
+        # isin() rule check run per-category instead of per-row, and the
+        # Parquet writer dictionary-encodes it for free
+        df['region'] = df['region'].astype('category')
+
         logger.info("Schema validation passed")
         return df
     
-    def remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove duplicate transaction IDs"""
-        logger.info("Checking for duplicates...")
-        
-        initial_count = len(df)
-        df = df.drop_duplicates(subset=['transaction_id'], keep='first')
-        duplicates = initial_count - len(df)
-        
-        self.metrics['duplicates_removed'] = duplicates
-        logger.info(f"Removed {duplicates} duplicate records")
-        
-        return df
-    
-    def remove_nulls(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove records with null values"""
-        logger.info("Checking for null values...")
-        
-        initial_count = len(df)
-        df = df.dropna()
-        nulls = initial_count - len(df)
-        
-        self.metrics['null_values_removed'] = nulls
-        logger.info(f"Removed {nulls} records with null values")
-        
+    @staticmethod
+    def _table_is_typed(table: pa.Table) -> bool:
+        """True when the CSV reader inferred the numeric/date columns,
+        i.e. no dirty token forced a column back to string"""
+        if set(config.REQUIRED_COLUMNS) - set(table.column_names):
+            return False
+        schema = table.schema
+        return (pa.types.is_integer(schema.field('quantity').type)
+                and pa.types.is_floating(schema.field('price').type)
+                and pa.types.is_timestamp(schema.field('date').type))
+
+    def apply_validation_mask_arrow(self, table: pa.Table) -> pd.DataFrame:
+        """Arrow fast path for the fused validation mask
+
+        When the CSV reader already inferred typed quantity/price/date
+        columns, every rule mask is computed by Arrow's multithreaded
+        C++ kernels and the table is filtered before it ever becomes a
+        DataFrame - only the surviving rows pay the pandas conversion.
+        Metric cascade order matches apply_validation_mask."""
+        logger.info("Validating records (arrow)...")
+
+        table = table.select(config.REQUIRED_COLUMNS)
+
+        ids = table['transaction_id'].to_pandas()
+        duplicate = ids.duplicated(keep='first').to_numpy()
+        survivors = ~duplicate
+        self.metrics['duplicates_removed'] += np.count_nonzero(duplicate)
+        logger.info("Removed %d duplicate records", np.count_nonzero(duplicate))
+
+        # Typed parse means conversion errors and unparseable dates
+        # already surfaced as nulls, so one null mask covers the
+        # null / type / date stages of the cascade
+        null_row = np.zeros(table.num_rows, dtype=bool)
+        for name in table.column_names:
+            null_row |= pc.is_null(table[name]).to_numpy(zero_copy_only=False)
+        nulls_removed = np.count_nonzero(survivors & null_row)
+        self.metrics['null_values_removed'] += nulls_removed
+        survivors &= ~null_row
+        logger.info("Removed %d records with null values", nulls_removed)
+
+        quantity, price = table['quantity'], table['price']
+        bad_quantity = pc.fill_null(
+            pc.or_(pc.less(quantity, config.MIN_QUANTITY),
+                   pc.greater(quantity, config.MAX_QUANTITY)), False
+        ).to_numpy(zero_copy_only=False)
+        bad_price = pc.fill_null(
+            pc.or_(pc.less(price, config.MIN_PRICE),
+                   pc.greater(price, config.MAX_PRICE)), False
+        ).to_numpy(zero_copy_only=False)
+        bad_region = pc.fill_null(
+            pc.invert(pc.is_in(table['region'],
+                               value_set=VALID_REGIONS_ARROW)), False
+        ).to_numpy(zero_copy_only=False)
+
+        self.metrics['invalid_quantity'] += np.count_nonzero(survivors & bad_quantity)
+        self.metrics['invalid_price'] += np.count_nonzero(survivors & bad_price)
+        self.metrics['invalid_region'] += np.count_nonzero(survivors & bad_region)
+
+        keep = np.logical_and.reduce(
+            [survivors, ~bad_quantity, ~bad_price, ~bad_region]
+        )
+        logger.info("Business rules rejected %d records",
+                    np.count_nonzero(survivors) - np.count_nonzero(keep))
+
+        df = table.filter(pa.array(keep)).to_pandas()
+        df['region'] = df['region'].astype('category')
+        df['quantity'] = df['quantity'].astype('int32')
+        df['date'] = df['date'].to_numpy().astype('datetime64[D]')
+
         return df
-    
-    def validate_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Convert and validate data types"""
-        logger.info("Validating data types...")
-        
-        try:
-            # Convert quantity to integer
-            df['quantity'] = pd.to_numeric(df['quantity'], errors='coerce').astype('Int64')
-            
-            # Convert price to float
-            df['price'] = pd.to_numeric(df['price'], errors='coerce')
-            
-            # Remove records with conversion errors
-            initial_count = len(df)
-            df = df.dropna(subset=['quantity', 'price'])
-            errors = initial_count - len(df)
-            
-            if errors > 0:
-                logger.warning(f"Removed {errors} records due to data type conversion errors")
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"Data type validation failed: {str(e)}")
-            raise
-    
-    def validate_business_rules(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply business validation rules"""
-        logger.info("Applying business rules...")
-        
-        initial_count = len(df)
-        
-        # Validate quantity
-        invalid_qty = df[
-            (df['quantity'] < config.MIN_QUANTITY) |
-            (df['quantity'] > config.MAX_QUANTITY)
-        ]
-        self.metrics['invalid_quantity'] = len(invalid_qty)
-        
-        # Validate price
-        invalid_price = df[
-            (df['price'] < config.MIN_PRICE) |
-            (df['price'] > config.MAX_PRICE)
-        ]
-        self.metrics['invalid_price'] = len(invalid_price)
-        
-        # Validate region
-        invalid_region = df[~df['region'].isin(config.VALID_REGIONS)]
-        self.metrics['invalid_region'] = len(invalid_region)
-        
-        # Keep only valid records
-        df = df[
-            (df['quantity'] >= config.MIN_QUANTITY) &
-            (df['quantity'] <= config.MAX_QUANTITY) &
-            (df['price'] >= config.MIN_PRICE) &
-            (df['price'] <= config.MAX_PRICE) &
-            (df['region'].isin(config.VALID_REGIONS))
-        ]
-        
-        rejected = initial_count - len(df)
-        logger.info(f"Business rules rejected {rejected} records")
-        
+
+    def apply_validation_mask(self, df: pd.DataFrame,
+                              seen_ids: _SeenIds = None) -> pd.DataFrame:
+        """Run the whole validation (duplicates, nulls, types, dates,
+        business rules) as one fused boolean-mask pass
+
+        Every rule mask is computed against the raw column arrays and
+        combined in a cascade that preserves the per-stage metric
+        counts, then the frame is sliced exactly once - instead of five
+        sequential passes each materializing an intermediate DataFrame.
+
+        When called per chunk from the streaming path, seen_ids carries
+        the transaction IDs already accepted by earlier chunks so
+        duplicates are still detected globally; metrics accumulate
+        across calls."""
+        logger.info("Validating records...")
+
+        # Typed views of the numeric/date columns (bad tokens -> NaN);
+        # when the reader already inferred the dtype - the usual case
+        # for the streaming chunks - the coercing re-parse is skipped
+        quantity = df['quantity']
+        if not pd.api.types.is_numeric_dtype(quantity):
+            quantity = pd.to_numeric(quantity, errors='coerce')
+        price = df['price']
+        if not pd.api.types.is_numeric_dtype(price):
+            price = pd.to_numeric(price, errors='coerce')
+        dates = df['date']
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors='coerce')
+
+        q = quantity.to_numpy(dtype='float64', na_value=np.nan)
+        p = price.to_numpy(dtype='float64', na_value=np.nan)
+
+        # Cascade of rule masks; each metric counts rows that survived
+        # the earlier rules, matching the old sequential pipeline
+        # Hash-based first-occurrence scan over the bare ID column; the
+        # rest of the frame is never touched until the final slice
+        ids = df['transaction_id']
+        duplicate = ids.duplicated(keep='first').to_numpy()
+        if seen_ids is not None:
+            duplicate = duplicate | seen_ids.contains(ids)
+            seen_ids.add(ids.to_numpy()[~duplicate])
+        survivors = ~duplicate
+        self.metrics['duplicates_removed'] += np.count_nonzero(duplicate)
+        logger.info("Removed %d duplicate records", np.count_nonzero(duplicate))
+
+        null_row = df.isna().any(axis=1).to_numpy()
+        nulls_removed = np.count_nonzero(survivors & null_row)
+        self.metrics['null_values_removed'] += nulls_removed
+        survivors &= ~null_row
+        logger.info("Removed %d records with null values", nulls_removed)
+
+        conversion_error = np.isnan(q) | np.isnan(p)
+        conversion_errors = np.count_nonzero(survivors & conversion_error)
+        if conversion_errors > 0:
+            logger.warning("Removed %d records due to data type conversion "
+                           "errors", conversion_errors)
+        survivors &= ~conversion_error
+
+        invalid_date = dates.isna().to_numpy()
+        invalid_dates = np.count_nonzero(survivors & invalid_date)
+        if invalid_dates > 0:
+            logger.warning("Removed %d records with invalid dates", invalid_dates)
+        survivors &= ~invalid_date
+
+        # Validate the category table once, then look it up per row by
+        # code (codes of -1 are null rows, already gone from survivors)
+        region = df['region']
+        category_valid = np.append(
+            region.cat.categories.isin(VALID_REGIONS), False
+        )
+        bad_region = ~category_valid[region.cat.codes.to_numpy()]
+
+        if numba is not None:
+            keep, n_quantity, n_price, n_region = _business_rules_jit(
+                q, p, bad_region, survivors,
+                float(config.MIN_QUANTITY), float(config.MAX_QUANTITY),
+                config.MIN_PRICE, config.MAX_PRICE
+            )
+            self.metrics['invalid_quantity'] += n_quantity
+            self.metrics['invalid_price'] += n_price
+            self.metrics['invalid_region'] += n_region
+        else:
+            bad_quantity = (q < config.MIN_QUANTITY) | (q > config.MAX_QUANTITY)
+            bad_price = (p < config.MIN_PRICE) | (p > config.MAX_PRICE)
+
+            self.metrics['invalid_quantity'] += np.count_nonzero(survivors & bad_quantity)
+            self.metrics['invalid_price'] += np.count_nonzero(survivors & bad_price)
+            self.metrics['invalid_region'] += np.count_nonzero(survivors & bad_region)
+
+            keep = np.logical_and.reduce(
+                [survivors, ~bad_quantity, ~bad_price, ~bad_region]
+            )
+        logger.info("Business rules rejected %d records",
+                    np.count_nonzero(survivors) - np.count_nonzero(keep))
+
+        # Single slice, then materialize the typed columns computed above.
+        # Valid rows have no NAs, so quantity fits a plain int32 (range
+        # check already capped it at MAX_QUANTITY) - half the bytes of
+        # the nullable Int64 for every downstream pass. Price stays
+        # float64: float32 can't hold cents exactly at MAX_PRICE scale.
+        df = df.loc[keep]
+        df['quantity'] = quantity[keep].astype('int32')
+        df['price'] = price[keep]
+        # Keep the date typed at day resolution instead of formatting
+        # back to strings row by row - Parquet stores it natively and
+        # the transformer skips its re-parse
+        df['date'] = dates[keep].to_numpy().astype('datetime64[D]')
+
         return df
     
-    def validate_dates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Validate and standardize date format"""
-        logger.info("Validating dates...")
-        
+    def process_file_streaming(self, input_key: str, output_key: str) -> Dict:
+        """Streaming validation pipeline: parses the raw CSV in chunks
+        straight off the S3 socket, validates each chunk with the fused
+        mask and appends the valid rows to an incremental Parquet
+        writer - O(chunk) peak memory instead of O(file)"""
         try:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            
-            # Remove records with invalid dates
-            initial_count = len(df)
-            df = df.dropna(subset=['date'])
-            invalid_dates = initial_count - len(df)
-            
-            if invalid_dates > 0:
-                logger.warning(f"Removed {invalid_dates} records with invalid dates")
-            
-            # Convert back to string format YYYY-MM-DD
-            df['date'] = df['date'].dt.strftime('%Y-%m-%d')
-            
-            return df
-            
+            logger.info("Starting streaming validation pipeline for %s", input_key)
+            start_time = datetime.now()
+            self._reset_metrics()
+
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=input_key)
+            reader = pd.read_csv(response['Body'], chunksize=config.CHUNK_SIZE,
+                                 usecols=config.REQUIRED_COLUMNS)
+
+            # Transaction IDs accepted so far, for cross-chunk dedup
+            seen_ids = _SeenIds()
+            buffer = BytesIO()
+            writer = None
+
+            for chunk in reader:
+                self.metrics['total_records'] += len(chunk)
+                chunk = self.validate_schema(chunk)
+                chunk = self.apply_validation_mask(chunk, seen_ids=seen_ids)
+                self.metrics['valid_records'] += len(chunk)
+                if chunk.empty:
+                    continue
+
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(buffer, table.schema, compression='zstd')
+                elif table.schema != writer.schema:
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+
+            if writer is not None:
+                writer.close()
+            else:
+                # Every chunk validated to zero rows (or the file was
+                # empty): still emit a typed, readable Parquet file
+                # instead of a 0-byte object downstream can't open
+                pq.write_table(VALIDATED_SCHEMA.empty_table(), buffer,
+                               compression='zstd')
+
+            logger.info("Writing %d records to s3://%s/%s",
+                        self.metrics['valid_records'], self.bucket_name, output_key)
+            buffer.seek(0)
+            self.s3_client.upload_fileobj(
+                buffer,
+                self.bucket_name,
+                output_key,
+                Config=S3_TRANSFER_CONFIG
+            )
+
+            processing_time = (datetime.now() - start_time).total_seconds()
+            rejection_rate = (
+                (self.metrics['total_records'] - self.metrics['valid_records']) /
+                self.metrics['total_records'] * 100
+            ) if self.metrics['total_records'] else 0.0
+
+            self.metrics['processing_time_seconds'] = processing_time
+            self.metrics['rejection_rate_percent'] = round(rejection_rate, 2)
+
+            logger.info("Streaming validation completed in %.2f seconds", processing_time)
+            logger.info(f"Valid records: {self.metrics['valid_records']:,} / "
+                       f"{self.metrics['total_records']:,} "
+                       f"({100-rejection_rate:.2f}% pass rate)")
+
+            return self.metrics
+
         except Exception as e:
-            logger.error(f"Date validation failed: {str(e)}")
+            logger.error("Streaming validation pipeline failed: %s", e)
             raise
-    
+
     def process_file(self, input_key: str, output_key: str) -> Dict:
         """Main validation pipeline"""
         try:
-            logger.info(f"Starting validation pipeline for {input_key}")
+            logger.info("Starting validation pipeline for %s", input_key)
             start_time = datetime.now()
-            
+            self._reset_metrics()
+
+            # Stream very large raw files in chunks instead of loading
+            # the whole CSV into memory at once
+            if input_key.endswith('.csv') and output_key.endswith('.parquet'):
+                size = self.s3_client.head_object(
+                    Bucket=self.bucket_name, Key=input_key
+                )['ContentLength']
+                if size > config.STREAMING_THRESHOLD_MB * 1024 * 1024:
+                    return self.process_file_streaming(input_key, output_key)
+
             # Read data
-            df = self.read_from_s3(input_key)
-            self.metrics['total_records'] = len(df)
-            
-            # Validation pipeline
-            df = self.validate_schema(df)
-            df = self.remove_duplicates(df)
-            df = self.remove_nulls(df)
-            df = self.validate_data_types(df)
-            df = self.validate_dates(df)
-            df = self.validate_business_rules(df)
+            table = self.read_from_s3(input_key)
+            self.metrics['total_records'] = table.num_rows
+
+            # Validation pipeline: one fused mask pass, in Arrow when
+            # the parse came back fully typed, else through pandas
+            if self._table_is_typed(table):
+                df = self.apply_validation_mask_arrow(table)
+            else:
+                df = self.validate_schema(table.to_pandas())
+                df = self.apply_validation_mask(df)
             
             self.metrics['valid_records'] = len(df)
             
@@ -251,12 +532,12 @@ class DataValidator:
             rejection_rate = (
                 (self.metrics['total_records'] - self.metrics['valid_records']) /
                 self.metrics['total_records'] * 100
-            )
+            ) if self.metrics['total_records'] else 0.0
             
             self.metrics['processing_time_seconds'] = processing_time
             self.metrics['rejection_rate_percent'] = round(rejection_rate, 2)
             
-            logger.info(f"Validation completed successfully in {processing_time:.2f} seconds")
+            logger.info("Validation completed successfully in %.2f seconds", processing_time)
             logger.info(f"Valid records: {self.metrics['valid_records']:,} / "
                        f"{self.metrics['total_records']:,} "
                        f"({100-rejection_rate:.2f}% pass rate)")
@@ -264,7 +545,7 @@ class DataValidator:
             return self.metrics
             
         except Exception as e:
-            logger.error(f"Validation pipeline failed: {str(e)}")
+            logger.error("Validation pipeline failed: %s", e)
             raise
     
     def print_metrics_summary(self):
@@ -284,34 +565,57 @@ class DataValidator:
         logger.info("="*60 + "\n")
 
 
+def _date_keys(date_str: str):
+    """S3 keys for one day: raw CSV in, validated Parquet out"""
+    input_key = f"{config.RAW_ZONE}/{date_str}.csv"
+    output_key = f"{config.PROCESSED_ZONE}/{date_str}.parquet"
+    return input_key, output_key
+
+
+def process_one_date(date_str: str) -> Dict:
+    """Validate a single day's file (also the thread-pool entry)"""
+    input_key, output_key = _date_keys(date_str)
+
+    validator = DataValidator(config.S3_BUCKET)
+    metrics = validator.process_file(input_key, output_key)
+    validator.print_metrics_summary()
+    return metrics
+
+
 def main():
     """Main execution function"""
-    
-    # Default to today's date if no argument provided
-    if len(sys.argv) > 1:
-        date_str = sys.argv[1]
+
+    parser = argparse.ArgumentParser(
+        description='Validate raw sales data (single date or date range)'
+    )
+    parser.add_argument('date', nargs='?', default=None,
+                        help='Date to process (YYYY-MM-DD, default: today)')
+    parser.add_argument('--start', help='Start of date range (YYYY-MM-DD)')
+    parser.add_argument('--end', help='End of date range (YYYY-MM-DD)')
+    args = parser.parse_args()
+
+    if args.start and args.end:
+        dates = [d.strftime('%Y-%m-%d') for d in pd.date_range(args.start, args.end)]
     else:
-        date_str = datetime.now().strftime('%Y-%m-%d')
-    
-    logger.info(f"Processing date: {date_str}")
-    
-    # Define S3 keys
-    input_key = f"{config.RAW_ZONE}/{date_str}.csv"
-    output_key = f"{config.PROCESSED_ZONE}/{date_str}.csv"
-    
+        dates = [args.date or datetime.now().strftime('%Y-%m-%d')]
+
     try:
-        # Initialize validator
-        validator = DataValidator(config.S3_BUCKET)
-        
-        # Process file
-        metrics = validator.process_file(input_key, output_key)
-        
-        # Print summary
-        validator.print_metrics_summary()
-        
+        if len(dates) == 1:
+            logger.info(f"Processing date: {dates[0]}")
+            process_one_date(dates[0])
+        else:
+            # Each day is an independent transfer+validate job, the S3
+            # sockets and the Arrow/numba kernels all release the GIL,
+            # so backfills fan out across threads
+            workers = min(len(dates), 8)
+            logger.info(f"Processing {len(dates)} dates "
+                       f"({dates[0]} → {dates[-1]}) with {workers} threads")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(process_one_date, dates))
+
         logger.info("✅ Validator completed successfully")
         return 0
-        
+
     except Exception as e:
         logger.error(f"❌ Validator failed: {str(e)}")
         return 1